@@ -1,13 +1,30 @@
 __version__ = "0.1.0"
 
-from .src import main
-from .utils import utils
-from .src.main import simulation
-from .src.main import post_process
-from .src.main_helper import execute
-try:
-    from .src.aerostruct import Problem # Requires mphys and other libraries. Causes problems when using in a different environment.
-except:
-    pass
-
-__all__ = ["main", "utils", "Problem", "simulation", "execute", "post_process"]
\ No newline at end of file
+import importlib
+
+# Attributes are imported on first access (PEP 562), so that importing `mdss` does not load mphys, openmdao and the plotting libraries until they are needed.
+# Maps attribute name -> (module, attribute in the module). Attribute is None when the module itself is exported.
+_LAZY_ATTRS = {
+    "main": (".src.main", None),
+    "utils": (".utils.utils", None),
+    "simulation": (".src.main", "simulation"),
+    "post_process": (".src.main", "post_process"),
+    "execute": (".src.main_helper", "execute"),
+    "Problem": (".src.aerostruct", "Problem"), # Requires mphys and other libraries.
+}
+
+# Load the subpackage here and drop the name, so that `mdss.utils` resolves to `mdss.utils.utils` through `__getattr__`.
+from . import utils as _utils_package
+del utils
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = _LAZY_ATTRS[name]
+    value = importlib.import_module(module_name, __name__)
+    if attr_name is not None:
+        value = getattr(value, attr_name)
+    globals()[name] = value # Cache, so that `__getattr__` is not called again for this name
+    return value
+
+__all__ = ["main", "utils", "Problem", "simulation", "execute", "post_process"]
@@ -1,9 +1,11 @@
 # This python file stores the defaults
+# The defaults are read-only, use `mdss.utils.helpers.copy_defaults` to get a mutable copy.
+from types import MappingProxyType
 
 ################################################################################
 # Default Adflow solver options for Aerodynamic problem
 ################################################################################
-default_aero_options_aerodynamic = {
+default_aero_options_aerodynamic = MappingProxyType({
     # Print Options
     "printIterations": False,
     "printAllOptions": False,
@@ -32,5 +34,4 @@ default_aero_options_aerodynamic = {
     "L2Convergence": 1e-12,
     "L2ConvergenceCoarse": 1e-2,
     "nCycles": 75000,
-}
-
+})
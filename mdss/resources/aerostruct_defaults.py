@@ -1,7 +1,10 @@
+# The defaults are read-only, use `mdss.utils.helpers.copy_defaults` to get a mutable copy.
+from types import MappingProxyType
+
 ################################################################################
 # Default Adflow solver options for AeroStructural problem
 ################################################################################
-default_aero_options_aerostructural = {
+default_aero_options_aerostructural = MappingProxyType({
     # Print Options
     "printIterations": False,
     "printAllOptions": False,
@@ -31,53 +34,53 @@ default_aero_options_aerostructural = {
     "nCycles": 10000,
     # force integration
     "forcesAsTractions": False,
-}
+})
 
 ################################################################################
 # Default structural properties for aerostructural problems
 ################################################################################
-default_struct_properties = {
+default_struct_properties = MappingProxyType({
     # Material Properties
     'rho': 2500.0,      # Density in kg/m^3
     'E': 70.0e9,        # Young's modulus in N/m^2
     'nu': 0.30,         # Poisson's ratio
     'kcorr': 5.0/6.0,   # Shear correction factor
     'ys': 350.0e6,      # Yeild stress
-}
+})
 
 ################################################################################
 # Default solver options for AeroStructural problem
 ################################################################################
-default_solver_options = {
-    'linear_solver_options': {
+default_solver_options = MappingProxyType({
+    'linear_solver_options': MappingProxyType({
         'atol': 1e-08, # absolute error tolerance
         'err_on_non_converge': True, # When True, AnalysisError will be raised if not convereged
         'maxiter': 25, # maximum number of iterations
         'rtol': 1e-8, # relative error tolerance
         'use_aitken': True, # set to True to use Aitken
-    },
+    }),
 
-    'nonlinear_solver_options': {
+    'nonlinear_solver_options': MappingProxyType({
         'atol': 1e-08, # absolute error tolerance
         'err_on_non_converge': True, # When True, AnalysisError will be raised if not convereged
         'reraise_child_analysiserror': False, # When the option is true, a solver will reraise any AnalysisError that arises during subsolve; when false, it will continue solving.
         'maxiter': 25, # maximum number of iterations
         'rtol': 1e-08, # relative error tolerance
         'use_aitken': True, # set to True to use Aitken
-    }
-}
+    })
+})
 
 ################################################################################
 # Default structural options for aerostructural problems
 ################################################################################
-default_struct_options = {
+default_struct_options = MappingProxyType({
     'iysm': 1, # y-symmetry
-}
+})
 
 ################################################################################
 # Default load info for aerostructural problems
 ################################################################################
-default_load_info = {
+default_load_info = MappingProxyType({
     'g': [0.0, -9.81, 0.0], # acceleration due to gravity in m/s^2
     'inertial_load_factor': 1.0 # inertial load factor, times of 'g'
-}
\ No newline at end of file
+})
\ No newline at end of file
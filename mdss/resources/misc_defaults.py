@@ -1,8 +1,11 @@
+from types import MappingProxyType
+
 ################################################################################
 # Default plot options
 ################################################################################
-def_plot_options = {
+def_plot_options = MappingProxyType({
             'niceplots_style' : 'james-light',
             'figsize': (20, 6),
+            'dpi': 200, # Resolution of the saved PNG files
             'colors': [], # Currently none. List of colors from niceplots will be used when user hasn't provided a list.
-        }
\ No newline at end of file
+        })
\ No newline at end of file
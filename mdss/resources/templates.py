@@ -35,22 +35,22 @@ execute(sim) # Run the simulation
 """
 
 ################################################################################
-# Template for Greatlakes Job script
+# Template for Greatlakes Job script, filled using `string.Template`
 ################################################################################
 gl_job_script = """#!/bin/bash
-#SBATCH --job-name={job_name}
-#SBATCH --nodes={nodes}
-#SBATCH --ntasks={nproc}
+#SBATCH --job-name=${job_name}
+#SBATCH --nodes=${nodes}
+#SBATCH --ntasks=${nproc}
 #SBATCH --ntasks-per-node=36
 #SBATCH --cpus-per-task=1
 #SBATCH --exclusive
-#SBATCH --mem-per-cpu={mem_per_cpu}
-#SBATCH --time={time}
-#SBATCH --account={account_name}
+#SBATCH --mem-per-cpu=${mem_per_cpu}
+#SBATCH --time=${time}
+#SBATCH --account=${account_name}
 #SBATCH --partition=standard
 #SBATCH --mail-type=BEGIN,END,FAIL
-#SBATCH --mail-user={email_id}
-#SBATCH --output={out_file}
+#SBATCH --mail-user=${email_id}
+#SBATCH --output=${out_file}
 
-python {python_file_path} --inputFile {yaml_file_path}
+python ${python_file_path} --inputFile ${yaml_file_path}
 """
@@ -3,10 +3,13 @@ from pydantic import BaseModel, model_validator, ValidationError
 from typing import Optional
 import yaml
 import os
+import pickle
+import functools
+import importlib.util
 import subprocess
-import niceplots
+import shlex
 
-from mdss.utils.helpers import ProblemType, MachineType
+from mdss.utils.helpers import ProblemType, MachineType, SafeLoader
 
 class ref_hpc_info(BaseModel):
     cluster: str
@@ -20,6 +23,19 @@ class ref_geometry_info(BaseModel):
     chordRef: float
     areaRef: float
 
+# Valid combinations of the flow condition parameters in a scenario, built once rather than on every validation
+valid_flow_conditions = tuple(frozenset(combination) for combination in [
+    {'mach', 'altitude'},
+    {'mach', 'reynolds', 'T'},
+    {'V', 'reynolds', 'T'},
+    {'mach', 'T', 'P'},
+    {'mach', 'T', 'rho'},
+    {'mach', 'P', 'rho'},
+    {'V', 'rho', 'T'},
+    {'V', 'rho', 'P'},
+    {'V', 'T', 'P'}
+])
+
 class ref_scenario_info(BaseModel):
     name: str
     aoa_list: list[float]
@@ -34,25 +50,13 @@ class ref_scenario_info(BaseModel):
 
     @model_validator(mode='before')
     def check_valid_conditions(cls, values):
-        # Define valid parameter combinations
-        valid_combinations = [
-            {'mach', 'altitude'},
-            {'mach', 'reynolds', 'T'},
-            {'V', 'reynolds', 'T'},
-            {'mach', 'T', 'P'},
-            {'mach', 'T', 'rho'},
-            {'mach', 'P', 'rho'},
-            {'V', 'rho', 'T'},
-            {'V', 'rho', 'P'},
-            {'V', 'T', 'P'}
-        ]
-
         # Extract provided parameters
-        provided_params = {key for key, value in values.items() if value is not None}
+        provided_params = frozenset(key for key, value in values.items() if value is not None)
 
         # Check if provided parameters match any valid combination
-        if not any(combination <= provided_params for combination in valid_combinations):
-            raise ValueError(f"Invalid parameter combination: {provided_params}.\nMust match one of the following combinations: {valid_combinations}")
+        if not any(combination <= provided_params for combination in valid_flow_conditions):
+            valid_combinations = [set(combination) for combination in valid_flow_conditions]
+            raise ValueError(f"Invalid parameter combination: {set(provided_params)}.\nMust match one of the following combinations: {valid_combinations}")
         return values
 
 ################################################################################
@@ -78,6 +82,8 @@ class ref_struct_options(BaseModel):
     load_info: Optional[ref_load_info]=None
     solver_options: Optional[dict]=None
 
+existing_mesh_files = set() # Mesh files found by the validations, the same meshes are typically shared by many cases. Missing files are checked again every time
+
 class ref_case_info(BaseModel):
     name: str
     problem: str
@@ -110,14 +116,59 @@ class ref_case_info(BaseModel):
     @model_validator(mode = 'after')
     def additonal_check(self):
         # To check if the mesh files specifies exists
+        meshes_folder_path = os.path.abspath(self.meshes_folder_path) # Same for all the refinement levels
         for ii, mesh_file in enumerate(self.mesh_files): # Loop for refinement levels to check if the grid files exist
-            aero_mesh_file  = os.path.join(os.path.abspath(self.meshes_folder_path), mesh_file)
+            aero_mesh_file  = os.path.join(meshes_folder_path, mesh_file)
+            if aero_mesh_file in existing_mesh_files: # Checked by a previous case or validation
+                continue
             if not os.path.isfile(aero_mesh_file):
                 raise FileNotFoundError(f"Aero Mesh: {aero_mesh_file} does not exist. Please provide a valid path")
+            existing_mesh_files.add(aero_mesh_file)
         
         return self
 
 
+def module_available(module_name):
+    """
+    Checks if a module can be located in the current environment. For a submodule, such as `tacs.mphys`, its parent packages are imported to locate it.
+
+    Inputs
+    ------
+    - **module_name** : str
+        Full name of the module.
+    """
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except Exception: # A missing parent package, or a parent package that fails to import, e.g. a broken Fortran build
+        return False
+
+@functools.lru_cache(maxsize=None)
+def has_modules(python_version, modules, import_code):
+    """
+    Checks if the modules required to run the simulations are available, in the current environment or else for `python_version`.
+    In the current environment, the modules are only located, not imported, as importing the solvers is slow. Otherwise `import_code` is run by `python_version` in a subprocess.
+    The result is cached, so that the check runs at most once per python version, rather than on every validation.
+
+    Inputs
+    ------
+    - **python_version** : str or None
+        Python executable to check, when the modules are not available in the current environment.
+        It is split like a shell command line, without starting a shell, so that it may include arguments, e.g. `conda run -n env python`.
+    - **modules** : tuple[str]
+        Full names of the modules imported by `import_code`, including the submodules such as `adflow.mphys`.
+    - **import_code** : str
+        Import statements to run with `python_version`.
+    """
+    if all(module_available(module_name) for module_name in modules):
+        return True
+    if python_version is None:
+        return False
+    try:
+        subprocess.run([*shlex.split(python_version), '-c', import_code], check=True) # No shell is started
+        return True
+    except (OSError, ValueError, subprocess.CalledProcessError): # ValueError for an unbalanced quote in `python_version`
+        return False
+
 class ref_hierarchy_info(BaseModel):
     name: str
     cases: list[ref_case_info]
@@ -145,21 +196,11 @@ class ref_sim_info(BaseModel):
             raise ValidationError("When running on a cluster,  `hpc_info` must be provided.")
         # Module checks
         # Common for Aero and Aerostructural Problems
-        try:
-            from mphys import MPhysVariables, Multipoint
-            from adflow.mphys import ADflowBuilder
-            from baseclasses import AeroProblem
-        except ImportError:
-            try:
-                subprocess.run(
-                    f"{self.python_version} -c 'from mphys import MPhysVariables; from adflow.mphys import ADflowBuilder; from baseclasses import AeroProblem'", 
-                    shell=True, check=True
-                )
-            except:
-                raise ModuleNotFoundError(
-                    "MPhys, ADflow, and baseclasses are required for aerodynamic and aerostructural problems. "
-                    "If available in another Python environment, specify its path in the input YAML under the key name 'python_version'."
-                )
+        if not has_modules(self.python_version, ('mphys', 'adflow.mphys', 'baseclasses'), 'from mphys import MPhysVariables; from adflow.mphys import ADflowBuilder; from baseclasses import AeroProblem'):
+            raise ModuleNotFoundError(
+                "MPhys, ADflow, and baseclasses are required for aerodynamic and aerostructural problems. "
+                "If available in another Python environment, specify its path in the input YAML under the key name 'python_version'."
+            )
         # Specific to aerostructural case
         # Aggregate a flag by checking all cases to see if any are aerostructural.
         is_aerostructural = any(
@@ -169,20 +210,11 @@ class ref_sim_info(BaseModel):
         )
         
         if is_aerostructural: # Instead of checking per case, do a one-time module check here.
-            try:
-                from tacs.mphys import TacsBuilder
-                from funtofem.mphys import MeldBuilder
-            except ImportError:
-                try:
-                    subprocess.run(
-                        f"{self.python_version} -c 'from tacs.mphys import TacsBuilder; from funtofem.mphys import MeldBuilder'", 
-                        shell=True, check=True
-                    )
-                except:
-                    raise ModuleNotFoundError(
-                        "TACS and FuntoFEM packages are required for aerostructural problems. "
-                        "If available in another Python environment, specify its path in the input YAML under the key name 'python_version'."
-                    )
+            if not has_modules(self.python_version, ('tacs.mphys', 'funtofem.mphys'), 'from tacs.mphys import TacsBuilder; from funtofem.mphys import MeldBuilder'):
+                raise ModuleNotFoundError(
+                    "TACS and FuntoFEM packages are required for aerostructural problems. "
+                    "If available in another Python environment, specify its path in the input YAML under the key name 'python_version'."
+                )
         return self
     
     
@@ -192,10 +224,12 @@ class ref_sim_info(BaseModel):
 class ref_plot_options(BaseModel):
     niceplots_style: str
     figsize: tuple[float, float]
+    dpi: int
     colors: list[str]
 
     @model_validator(mode='before')
     def check_valid_conditions(cls, values):
+        import niceplots # Imported here, as it is only needed for post processing
         valid_styles = niceplots.get_available_styles() # Define valid styles
         style = values.get('niceplots_style')
         if style not in valid_styles:
@@ -206,7 +240,9 @@ class ref_plot_options(BaseModel):
             )
         return values
 
-def check_input_yaml(yaml_file):
+sim_info_validator = ref_sim_info.__pydantic_validator__ # Built once with the model, used directly rather than through `model_validate`
+
+def check_input_yaml(yaml_file, comm=None):
     """
     Validates the structure of the input YAML file against predefined templates.
 
@@ -214,8 +250,10 @@ def check_input_yaml(yaml_file):
 
     Inputs
     ----------
-    - **yaml_file** : str
-        Path to the YAML file to be validated.
+    - **yaml_file** : str or dict
+        Path to the YAML file to be validated, or its already loaded content, which is validated without reading the file again.
+    - **comm** : MPI communicator, optional
+        When provided, only the root process reads and validates the input, and the outcome is broadcast to the other processes. So, it must be called by all the processes in `comm`.
 
     Outputs
     ------
@@ -227,7 +265,37 @@ def check_input_yaml(yaml_file):
     - Uses `ref_sim_info` pydantic model for validation.
     - Ensures hierarchical consistency at all levels of the YAML structure.
     """
+    if comm is not None and comm.size > 1:
+        error = shared_error = None
+        if comm.rank == 0:
+            try:
+                check_input_yaml(yaml_file)
+            except Exception as e:
+                error = shared_error = e
+            try: # Make sure the error can be broadcast, otherwise the other processes would wait forever
+                pickle.dumps(shared_error)
+            except Exception:
+                shared_error = ValueError(f"{type(error).__name__}: {error}") # Stand-in for the other processes only
+        shared_error = comm.bcast(shared_error, root=0)
+        if error is not None:
+            raise error # The original exception, with its traceback, on the root process
+        if shared_error is not None:
+            raise shared_error
+        return
+    if isinstance(yaml_file, dict):
+        return check_input_dict(yaml_file)
     with open(yaml_file, 'r') as file:
-        sim_info = yaml.safe_load(file)
+        sim_info = yaml.load(file, Loader=SafeLoader)
     
-    ref_sim_info.model_validate(sim_info)               
+    check_input_dict(sim_info)
+
+def check_input_dict(sim_info):
+    """
+    Validates the content of an input YAML file, already loaded as a dictionary. See `check_input_yaml`.
+
+    Inputs
+    ----------
+    - **sim_info** : dict
+        Content of the input YAML file.
+    """
+    sim_info_validator.validate_python(sim_info)               
@@ -1,8 +1,18 @@
 # src/__init__.py
-from .main import simulation, post_process
-try:
-    from .aerostruct import Problem
-except:
-    pass
+import importlib
 
-__all__ = ["simulation", "post_process", "Problem"]
\ No newline at end of file
+# Attributes are imported on first access (PEP 562). `Problem` requires mphys and other libraries.
+_LAZY_ATTRS = {
+    "simulation": ".main",
+    "post_process": ".main",
+    "Problem": ".aerostruct",
+}
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+__all__ = ["simulation", "post_process", "Problem"]
@@ -17,7 +17,7 @@ except:
     pass
 import openmdao.api as om
 
-from mdss.utils.helpers import ProblemType, load_yaml_file, print_msg, update_om_instance, get_restart_file
+from mdss.utils.helpers import ProblemType, make_dir, load_yaml_file, load_json_file, print_msg, update_om_instance, get_restart_file, copy_defaults
 from mdss.resources.aero_defaults import default_aero_options_aerodynamic
 from mdss.resources.aerostruct_defaults import *
 
@@ -188,15 +188,23 @@ class Top(Multipoint):
         # connect to the aero for each scenario
         self.connect("aoa", [variable_to_connect, f"{self.sim_info['scenario_name']}.aero_post.aoa"])
     
+def load_info_file(info_fpath):
+    """
+    Loads the case or scenario info file written by `execute`. JSON files are written by the current version, YAML files are still accepted.
+    """
+    if info_fpath.endswith('.json'):
+        return load_json_file(info_fpath, comm)
+    return load_yaml_file(info_fpath, comm)
+
 class Problem:
 
     def __init__(self, case_info_fpath, scenario_info_fpath, ref_level_dir, aoa_csv_str, aero_grid_fpath, struct_mesh_fpath=None):
 
         # Extarct the required info
-        case_info = load_yaml_file(case_info_fpath, comm)
+        case_info = load_info_file(case_info_fpath)
         self.case_info = case_info
 
-        scenario_info = load_yaml_file(scenario_info_fpath, comm)
+        scenario_info = load_info_file(scenario_info_fpath)
         self.scenario_info = scenario_info
         
         aoa_list = [float(x) for x in aoa_csv_str.split(',')]
@@ -214,13 +222,13 @@ class Problem:
         # Assigning defaults
         # Read the respective default_aero_options
         if problem_type == ProblemType.AERODYNAMIC:
-            aero_options = default_aero_options_aerodynamic.copy() # Assign default options for aerodynamic case
+            aero_options = copy_defaults(default_aero_options_aerodynamic) # Assign default options for aerodynamic case
         elif problem_type == ProblemType.AEROSTRUCTURAL:
             isym = case_info['struct_options']['isym']
-            solver_options = default_solver_options
-            aero_options = default_aero_options_aerostructural.copy() # Assign default aero_options for aerostructural case
-            structural_properties.update(default_struct_properties.copy()) # Assign default structural properties
-            load_info = default_load_info.copy()
+            solver_options = copy_defaults(default_solver_options)
+            aero_options = copy_defaults(default_aero_options_aerostructural) # Assign default aero_options for aerostructural case
+            structural_properties.update(default_struct_properties) # Assign default structural properties
+            load_info = copy_defaults(default_load_info)
             structural_properties.update({'t': case_info['struct_options']['t']}) # Update thickness with user given values
             # Update default values with user given data 
             struct_options = case_info.get('struct_options', {})
@@ -293,9 +301,8 @@ class Problem:
                     msg = f"Skipping Angle of Attack (AoA): {float(aoa):<5} | Reason: Existing successful simulation found"
                     print_msg(msg, 'notice', comm)
                     continue # Continue to next loop if there exists a successful simulation
-            elif not os.path.exists(aoa_out_dir): # Create the directory if it doesn't exist
-                if comm.rank == 0:
-                    os.makedirs(aoa_out_dir)
+            else:
+                make_dir(aoa_out_dir, comm) # Create the directory if it doesn't exist
             ################################################################################
             # Run sim when a succesful simulation is not found
             ################################################################################
@@ -1,25 +1,39 @@
 import os
+import sys
 import time
-import copy
 from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
 
-import pandas as pd
-import numpy as np
 import yaml
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
-from matplotlib.lines import Line2D
-from matplotlib.legend import Legend
-import niceplots
 from mpi4py import MPI
 
-from mdss.utils.helpers import load_yaml_file, load_csv_data, make_dir, print_msg, MachineType
+from mdss.utils.helpers import load_yaml_file, load_csv_columns, make_dir, print_msg, MachineType, copy_defaults
 from mdss.src.main_helper import execute, submit_job_on_hpc
 from mdss.resources.misc_defaults import def_plot_options
 from mdss.resources.yaml_config import ref_plot_options, check_input_yaml
 
 
 comm = MPI.COMM_WORLD
+_csv_read_pool = ThreadPoolExecutor(max_workers=8) # To read the CSV files of a scenario concurrently. Threads are started on first use
+
+# Plotting modules, imported by `_import_plotting_modules` when `post_process` is used, so that running simulations does not pay for importing them
+matplotlib = plt = Line2D = Legend = niceplots = None
+
+def _import_plotting_modules():
+    """
+    Imports matplotlib and niceplots into the module namespace on the first call.
+    """
+    global matplotlib, plt, Line2D, Legend, niceplots
+    if plt is not None:
+        return
+    import matplotlib
+    # Figures are only saved to files, so the non-interactive Agg backend is used, unless the user selects one or has already imported pyplot with their own backend
+    if 'MPLBACKEND' not in os.environ and 'matplotlib.pyplot' not in sys.modules:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.lines import Line2D
+    from matplotlib.legend import Legend
+    import niceplots
 
 class simulation():
     """
@@ -39,13 +53,12 @@ class simulation():
     """
 
     def __init__(self, info_file):
-        # Validate the input yaml file
-        check_input_yaml(info_file)
-        msg = f"YAML file validation is successful"
-        print_msg(msg, None, comm)
-
         self.info_file = info_file
         self.sim_info = load_yaml_file(self.info_file, comm)
+        # Validate the input yaml file, using the content loaded above rather than parsing the file again
+        check_input_yaml(self.sim_info, comm) # Validated on the root processor only
+        msg = f"YAML file validation is successful"
+        print_msg(msg, None, comm)
         self.out_dir = os.path.abspath(self.sim_info['out_dir'])
         self.machine_type = MachineType.from_string(self.sim_info['machine_type'])  # Convert string to enum
         # Additional options
@@ -71,12 +84,11 @@ class simulation():
         - For local execution, it directly calls `run_problem()`.
         - For HPC execution, it creates a Python file and a job script, then submits the job.
         """
-        sim_info_copy = copy.deepcopy(self.sim_info)
         if self.machine_type == MachineType.LOCAL: # Running on a local machine
             execute(self)
 
         elif self.machine_type == MachineType.HPC: # Running on a HPC currently supports Great Lakes.
-            submit_job_on_hpc(sim_info_copy, self.info_file, comm) # Submit job script
+            submit_job_on_hpc(dict(self.sim_info, out_dir=self.out_dir), self.info_file, comm) # Submit job script. Shallow copy with the absolute path of the output directory, computed once in `__init__`
 
                        
 ################################################################################
@@ -106,17 +118,24 @@ class post_process:
     - **_add_plot_from_csv(axs, csv_file, **kwargs)**  
         Adds a single line plot for C<sub>L</sub> and C<sub>D</sub> from a CSV file to existing subplots.
 
+    - **_load_plot_data(csv_file)**  
+        Returns the Alpha, C<sub>L</sub> and C<sub>D</sub> data from a CSV file, cached across plots.
+
     - **_add_scenario_level_plots(axs, scenario_name, exp_data, mesh_files, scenario_out_dir, **kwargs)**  
         Adds plots for a given scenario, including experimental and refinement-level simulation results.
 
     - **_create_fig(title, niceplots_style=None)**  
         Initializes and returns a styled matplotlib figure with two subplots.
 
+    - **_reset_axes(axs)**  
+        Clears the two subplots and sets their titles, labels, and grids.
+
     - **_get_marker_style(idx)**  
         Returns a marker style based on the index, used to distinguish between scenarios visually.
     """
 
     def __init__(self, out_dir: str, plot_options: dict={}):
+        _import_plotting_modules()
         self.out_dir = os.path.abspath(out_dir)
         self.final_out_file = os.path.join(self.out_dir, "overall_sim_info.yaml") # Setting the overall simulation info file.
         try:
@@ -127,9 +146,21 @@ class post_process:
             raise FileNotFoundError("")
 
         # Additional Options
-        plot_options = def_plot_options
-        plot_options.update(plot_options)
-        self.plot_options = ref_plot_options.model_validate(plot_options)
+        plot_options_updt = copy_defaults(def_plot_options)
+        plot_options_updt.update(plot_options) # Update the defaults with user given options
+        self.plot_options = ref_plot_options.model_validate(plot_options_updt)
+        self.print_warnings = True # To toggle the warnings for missing or unreadable data while plotting.
+        self._msg_comm = comm # Communicator passed to `print_msg` for the warnings, set to None while each processor plots its own cases
+        self._csv_cache = {} # Parsed CSV data, keyed on the path and modification time of the file
+        self._scenario_index = None # Scenarios keyed on (hierarchy, case, scenario) names, built on the first `custom_compare` call
+        # Style parameters, read once and applied only around the figures of this instance, so that matplotlib's global settings are left untouched
+        self._style = dict(matplotlib.rc_params_from_file(niceplots.get_style(self.plot_options.niceplots_style), use_default_template=False))
+        # Colors and markers of the plots, resolved once
+        with plt.style.context(self._style): # niceplots reads the colors of the style in use
+            self._colors = self.plot_options.colors or niceplots.get_colors_list() # List of colors from niceplots is used when user hasn't provided a list
+        self._markers = ['s', 'o', '^', 'v','X', 'P', '.', 'H', 'p', '*', 'h', '+', 'x']
+        # PNG options for the saved figures. Low zlib compression level, which encodes much faster for a slightly larger file
+        self._png_format_kwargs = {"png": {"dpi": self.plot_options.dpi, "pil_kwargs": {"compress_level": 1}}}
         
     def gen_case_plots(self):
         """
@@ -151,30 +182,44 @@ class post_process:
         - Experimental data is optional. If not provided, only simulation data is plotted.
         - Markers distinguish scenarios; colors distinguish mesh refinement levels.
         - A shared legend is placed outside the figure to indicate scenario markers.
-        - Axis spines are formatted using `niceplots.adjust_spines()` and figures are saved at high resolution (400 dpi).
+        - Axis spines are formatted using `niceplots.adjust_spines()` and figures are saved at the resolution set by the `dpi` plot option (200 dpi by default).
         - Figures are titled using the case name and saved using `niceplots.save_figs()`.
+        - When run with multiple processors, the cases are distributed over the processors, and each figure is saved by one processor.
+          It is a collective call: every processor of `MPI.COMM_WORLD` must call it, otherwise it waits indefinitely at the final barrier.
         """
-        sim_out_info = copy.deepcopy(self.sim_out_info)
-        for hierarchy, hierarchy_info in enumerate(sim_out_info['hierarchies']): # loop for Hierarchy level
-            for case, case_info in enumerate(hierarchy_info['cases']): # loop for cases in hierarchy
-                scenario_legend_entries = []
-                fig, axs = self._create_fig(case_info["name"].replace("_", " ").upper()) # Create Figure
-                colors = self.plot_options.colors
-                if not colors:  # Checks if the list is empty
-                    colors = niceplots.get_colors_list()
-                for scenario, scenario_info in enumerate(case_info['scenarios']): # loop for scenarios that may present
-                    scenario_out_dir = scenario_info['sim_info']['scenario_out_dir']
-                    plot_args = {
-                        'label': scenario_info['name'].replace("_", " ").upper(),
-                        'color': colors[scenario]
-                    }
-                    # To generate plots comparing the refinement levels
-                    scenario_legend_entry = self._add_scenario_level_plots(axs, scenario_info['name'], scenario_info.get('exp_data', None), case_info['mesh_files'], scenario_out_dir, **plot_args)
-                    scenario_legend_entries.append(scenario_legend_entry)
-                ################################# End of Scenario loop ########################################
-                self._set_legends(fig, axs, scenario_legend_entries)
-                fig_name = os.path.join(os.path.dirname(scenario_out_dir), case_info['name'])
-                niceplots.save_figs(fig, fig_name, ["png"], format_kwargs={"png": {"dpi": 400}}, bbox_inches="tight")
+        # Each figure is independent, so the cases are distributed over the processors
+        case_list = [case_info for hierarchy_info in self.sim_out_info['hierarchies'] for case_info in hierarchy_info['cases']]
+        fig = None # One figure is created, and reused for all the cases
+        self._msg_comm = None # Every processor prints the warnings for its own cases
+        with plt.style.context(self._style): # Style of this instance, for the figures and their saving
+            try:
+                for case_info in case_list[comm.rank::comm.size]: # loop for cases assigned to this processor
+                    scenario_legend_entries = []
+                    title = case_info["name"].replace("_", " ").upper()
+                    if fig is None:
+                        fig, axs = self._create_fig(title) # Create Figure
+                    else:
+                        fig.suptitle(title)
+                        self._reset_axes(axs) # Clear the plots of the previous case
+                    for scenario, scenario_info in enumerate(case_info['scenarios']): # loop for scenarios that may present
+                        scenario_out_dir = scenario_info['sim_info']['scenario_out_dir']
+                        plot_args = {
+                            'label': scenario_info['name'].replace("_", " ").upper(),
+                            'color': self._colors[scenario]
+                        }
+                        # To generate plots comparing the refinement levels
+                        scenario_legend_entry = self._add_scenario_level_plots(axs, scenario_info['name'], scenario_info.get('exp_data', None), case_info['mesh_files'], scenario_out_dir, **plot_args)
+                        scenario_legend_entries.append(scenario_legend_entry)
+                    ################################# End of Scenario loop ########################################
+                    mesh_legend = self._set_legends(fig, axs, scenario_legend_entries)
+                    fig_name = os.path.join(os.path.dirname(scenario_out_dir), case_info['name'])
+                    niceplots.save_figs(fig, fig_name, ["png"], format_kwargs=self._png_format_kwargs, bbox_inches="tight")
+                    mesh_legend.remove() # The legend is specific to the case
+            finally:
+                if fig is not None:
+                    plt.close(fig)
+                self._msg_comm = comm # Restored even if plotting fails, so that later warnings are printed once
+        comm.Barrier() # Wait for all the figures to be saved
 
     def custom_compare(self, custom_compare_info: dict, plt_name: str):
         """
@@ -223,50 +268,49 @@ class post_process:
         - Experimental data is included when available.
         - A shared legend (outside the plot) shows scenario identifiers and their corresponding markers.
         """
-        sim_out_info = copy.deepcopy(self.sim_out_info)
-        fig, axs = self._create_fig(plt_name.replace("_", " ").upper()) # Create Figure
-        scenario_legend_entries = []
-        found_scenarios = False
-        count = 0 # To get marker style
-        colors = self.plot_options.colors
-        if not colors:  # Checks if the list is empty
-            colors = niceplots.get_colors_list()
-        scenarios_list = [] 
-        for hierarchy, hierarchy_info in custom_compare_info.items():
-            for case, case_info in hierarchy_info.items():
-                for scenario in case_info['scenarios']:
-                    scenario_info = {'hierarchy':hierarchy, 'case': case, 'scenario': scenario}
-                    if 'mesh_files' in case_info.keys():
-                        scenario_info['mesh_files'] = case_info['mesh_files']
-                    scenarios_list.append(scenario_info)
-        for s in scenarios_list:
-            for hierarchy_info in sim_out_info['hierarchies']:
-                if hierarchy_info['name'] != s['hierarchy']:
+        with plt.style.context(self._style): # Style of this instance, for the figure and its saving
+            fig, axs = self._create_fig(plt_name.replace("_", " ").upper()) # Create Figure
+            scenario_legend_entries = []
+            found_scenarios = False
+            count = 0 # To get marker style
+            scenarios_list = [] 
+            for hierarchy, hierarchy_info in custom_compare_info.items():
+                for case, case_info in hierarchy_info.items():
+                    for scenario in case_info['scenarios']:
+                        scenario_info = {'hierarchy':hierarchy, 'case': case, 'scenario': scenario}
+                        if 'mesh_files' in case_info.keys():
+                            scenario_info['mesh_files'] = case_info['mesh_files']
+                        scenarios_list.append(scenario_info)
+            if self._scenario_index is None: # Index the scenarios by (hierarchy, case, scenario) names, built once
+                self._scenario_index = {
+                    (hierarchy_info['name'], case_info['name'], scenario_info['name']): (case_info, scenario_info)
+                    for hierarchy_info in self.sim_out_info['hierarchies']
+                    for case_info in hierarchy_info['cases']
+                    for scenario_info in case_info['scenarios']
+                }
+            for s in scenarios_list:
+                found = self._scenario_index.get((s['hierarchy'], s['case'], s['scenario']))
+                if found is None:
                     continue
-                for case_info in hierarchy_info['cases']:
-                    if case_info['name'] != s['case']:
-                        continue
-                    for scenario_info in case_info['scenarios']:
-                        if scenario_info['name'] != s['scenario']:
-                            continue
-                        found_scenarios = True
-                        mesh_files = s.get('mesh_files', case_info['mesh_files'])
-                        scenario_out_dir = scenario_info['sim_info'].get('scenario_out_dir', '.')
-                        label = f"{case_info['name']} - {scenario_info['name']}"
-                        plot_args = {
-                            'label': label.replace("_", " ").upper(),
-                            'color': colors[count]
-                        }
-                        scenario_legend_entry = self._add_scenario_level_plots(axs, scenario_info['name'], scenario_info.get('exp_data', None), mesh_files, scenario_out_dir, **plot_args)
-                        scenario_legend_entries.append(scenario_legend_entry)
-                        count+=1
+                case_info, scenario_info = found
+                found_scenarios = True
+                mesh_files = s.get('mesh_files', case_info['mesh_files'])
+                scenario_out_dir = scenario_info['sim_info'].get('scenario_out_dir', '.')
+                label = f"{case_info['name']} - {scenario_info['name']}"
+                plot_args = {
+                    'label': label.replace("_", " ").upper(),
+                    'color': self._colors[count]
+                }
+                scenario_legend_entry = self._add_scenario_level_plots(axs, scenario_info['name'], scenario_info.get('exp_data', None), mesh_files, scenario_out_dir, **plot_args)
+                scenario_legend_entries.append(scenario_legend_entry)
+                count+=1
 
-        if not found_scenarios:
-            return ValueError("None of the scenarios are found")
+            if not found_scenarios:
+                return ValueError("None of the scenarios are found")
 
-        self._set_legends(fig, axs, scenario_legend_entries)
-        fig_name = os.path.join(self.out_dir, plt_name)
-        niceplots.save_figs(fig, fig_name, ["png"], format_kwargs={"png": {"dpi": 400}}, bbox_inches="tight")
+            self._set_legends(fig, axs, scenario_legend_entries)
+            fig_name = os.path.join(self.out_dir, plt_name)
+            niceplots.save_figs(fig, fig_name, ["png"], format_kwargs=self._png_format_kwargs, bbox_inches="tight")
                     
     def _add_plot_from_csv(self, axs, csv_file:str, **kwargs):
         """
@@ -293,6 +337,8 @@ class post_process:
                     Line style for the plotted line. Default is '--'.
                 - *marker* : str  
                     Marker style for the data points. Default is 's'.
+                - *sim_data* : tuple[numpy.ndarray] or None  
+                    Data of `csv_file` already returned by `_load_plot_data`. The file is read when not provided.
 
         Outputs
         --------
@@ -309,19 +355,51 @@ class post_process:
         linestyle = kwargs.get('linestyle', '--')
         marker = kwargs.get('marker', 's')
 
-        sim_data = load_csv_data(csv_file, comm)
+        if 'sim_data' in kwargs: # Loaded in advance by the caller
+            sim_data = kwargs['sim_data']
+        else:
+            sim_data = self._load_plot_data(csv_file)
         if sim_data is not None:
-            for ax, y_key in zip(axs, ['CL', 'CD']):
-                ax.plot(
-                    sim_data['Alpha'], sim_data[y_key],
+            alpha, cl, cd = sim_data
+            for ax, y_data in zip(axs, [cl, cd]):
+                # Add the line as an artist directly, the axis limits are autoscaled once per figure in `_set_legends`
+                ax.add_line(Line2D(
+                    alpha, y_data,
                     label=label,
                     color=color,
                     linestyle=linestyle,
                     marker=marker
-                )
-        else:
+                ))
+        elif self.print_warnings: # The message is not built otherwise
             msg = f"{csv_file} is not readable.\nContinuing to plot without '{label}' data."
-            print_msg(msg, 'warning', comm)
+            print_msg(msg, 'warning', self._msg_comm)
+
+    def _load_plot_data(self, csv_file:str):
+        """
+        Returns the Alpha, C<sub>L</sub> and C<sub>D</sub> arrays from a CSV file, reusing the previously parsed data if the file is unchanged.
+
+        The same files are plotted by `gen_case_plots` and `custom_compare`, so the parsed data is stored in `self._csv_cache` using the path and modification time of the file as the key.
+
+        Inputs
+        -------
+        - **csv_file**: str
+            Path to the CSV file containing simulation or experimental data.
+
+        Outputs
+        --------
+        - **tuple[numpy.ndarray] or None**:
+            Arrays of Alpha, C<sub>L</sub> and C<sub>D</sub>, or None if the file cannot be read.
+        """
+        try:
+            cache_key = (csv_file, os.stat(csv_file).st_mtime_ns)
+        except OSError: # Missing files are reported by the loader
+            return load_csv_columns(csv_file, self._msg_comm, columns=('Alpha', 'CL', 'CD'))
+        if cache_key not in self._csv_cache:
+            sim_data = load_csv_columns(csv_file, self._msg_comm, columns=('Alpha', 'CL', 'CD'))
+            if sim_data is None:
+                return None
+            self._csv_cache[cache_key] = sim_data
+        return self._csv_cache[cache_key]
 
     def _add_scenario_level_plots(self, axs, scenario_name, exp_data, mesh_files, scenario_out_dir, **kwargs):
         """
@@ -329,7 +407,7 @@ class post_process:
 
         This method:
         - Plots experimental data for the scenario if a valid CSV path is provided.
-        - Loops over mesh refinement levels and plots ADflow results from each mesh file.
+        - Loops over mesh refinement levels and plots ADflow results from each mesh file. The CSV files are read concurrently.
         - Creates a `Line2D` entry for the scenario to be used in an external legend.
 
         Inputs
@@ -369,8 +447,9 @@ class post_process:
 
         Notes
         ------
-        - Experimental data will only be plotted if the provided `exp_data` file is valid.
+        - Experimental data will only be plotted if the provided `exp_data` file exists and is valid.
         - Simulation results are expected to be located in `${scenario_out_dir}/${mesh_file}/ADflow_output.csv`.
+        - Refinement levels without a directory in `scenario_out_dir` are skipped with a warning.
         """
         scenario_label = scenario_name.replace("_", " ")
 
@@ -380,18 +459,40 @@ class post_process:
         marker = kwargs.get('marker', 's')
         markersize = kwargs.get('markersize', 8)
 
-        if exp_data:  # Add plots experimental data to the plot
+        exp_data_present = bool(exp_data) and os.path.isfile(exp_data)
+        if exp_data and not exp_data_present and self.print_warnings: # Skip the loader for missing files
+            msg = f"{exp_data} does not exist.\nContinuing to plot without '{label} - Experimental' data."
+            print_msg(msg, 'warning', self._msg_comm)
+        try: # Refinement level directories in the scenario output directory, listed once rather than probing every file
+            refinement_levels_present = {entry.name for entry in os.scandir(scenario_out_dir) if entry.is_dir()}
+        except OSError:
+            refinement_levels_present = set()
+        refinement_levels = [] # (index, mesh_file, csv file) of the refinement levels to plot
+        for ii, mesh_file in enumerate(mesh_files): # Loop for refinement levels
+            if f"{mesh_file}" not in refinement_levels_present: # Not simulated yet
+                if self.print_warnings:
+                    msg = f"No results for {mesh_file} in {scenario_out_dir}.\nContinuing to plot without '{label} - {mesh_file}' data."
+                    print_msg(msg, 'warning', self._msg_comm)
+                continue
+            refinement_level_dir = os.path.join(scenario_out_dir, f"{mesh_file}")
+            refinement_levels.append((ii, mesh_file, os.path.join(refinement_level_dir, "ADflow_output.csv")))
+
+        # Read all the CSV files of the scenario concurrently, the plots are added in order below
+        csv_files = ([exp_data] if exp_data_present else []) + [csv_file for _, _, csv_file in refinement_levels]
+        sim_data_futures = [_csv_read_pool.submit(self._load_plot_data, csv_file) for csv_file in csv_files]
+        sim_data_list = [future.result() for future in sim_data_futures]
+
+        if exp_data_present:  # Add plots experimental data to the plot
             exp_args = {
                 'label': f"{label} - Experimental",
                 'color': color,
                 'linestyle': '',
                 'marker': 'D',
                 'markersize': markersize + 4,
+                'sim_data': sim_data_list.pop(0),
             }
             self._add_plot_from_csv(axs, exp_data, **exp_args)
-        for ii, mesh_file in enumerate(mesh_files): # Loop for refinement levels
-            refinement_level_dir = os.path.join(scenario_out_dir, f"{mesh_file}")
-            ADflow_out_file = os.path.join(refinement_level_dir, "ADflow_output.csv")
+        for (ii, mesh_file, ADflow_out_file), sim_data in zip(refinement_levels, sim_data_list): # Loop for refinement levels
             # Update kwargs
             plot_args = {
                     'label': f"{label} - {mesh_file}",
@@ -399,10 +500,11 @@ class post_process:
                     'linestyle': '-',
                     'marker': self._get_marker_style(ii),
                     'markersize': markersize,
+                    'sim_data': sim_data,
                 }
             self._add_plot_from_csv(axs, ADflow_out_file, **plot_args) # To add simulation data to the plots
         
-        scenario_legend_entry = Line2D([0], [0], marker=marker, color=color, linestyle='', markersize=markersize, label=label) # Create a legend entry for the scenario
+        scenario_legend_entry = Line2D((), (), marker=marker, color=color, linestyle='', markersize=markersize, label=label) # Create a legend entry for the scenario. Legend only proxy, so it holds no data
         return scenario_legend_entry
     
     def _create_fig(self, title, niceplots_style=None):
@@ -417,7 +519,7 @@ class post_process:
             Title to be shown at the top of the figure.
         
         - **niceplots_style**: str or None  
-            Optional name of the niceplots style to apply. If None, uses `self.niceplots_style`.
+            Optional name of the niceplots style to apply. If None, uses the style from the plot options, applied by the calling method.
 
         Outputs
         --------
@@ -431,25 +533,35 @@ class post_process:
         ------
         - Subplots are pre-configured with axis titles, labels, and grids.
         """
-        if niceplots_style is None:
-            niceplots_style = self.plot_options.niceplots_style
+        if niceplots_style is not None: # The default style is applied by the calling method, whose style context also undoes this one
+            plt.style.use(niceplots.get_style(niceplots_style))
         
         figsize = self.plot_options.figsize
 
-        plt.style.use(niceplots.get_style(niceplots_style))
         fig, axs = plt.subplots(1, 2, figsize=(14, 6), layout="constrained")
         fig.suptitle(title)
+        self._reset_axes(axs)
+
+        return fig, axs
 
+    def _reset_axes(self, axs):
+        """
+        Clears the subplots and sets the axis titles, labels, and grids, so that a figure can be reused for another plot.
+
+        Inputs
+        -------
+        - **axs**: list[matplotlib.axes._subplots.AxesSubplot]  
+            A list of two subplots for plotting C<sub>L</sub> and C<sub>D</sub> vs Alpha.
+        """
         titles = ['$C_L$ vs Alpha', '$C_D$ vs Alpha']
         ylabels = ['$C_L$', '$C_D$']
 
         for ax, subplot_title, ylabel in zip(axs, titles, ylabels):
+            ax.cla()
             ax.set_title(subplot_title)
             ax.set_xlabel('Alpha (deg)')
             ax.set_ylabel(ylabel)
             ax.grid(True)
-
-        return fig, axs
     
     def _set_legends(self, fig, axs, scenario_legend_entries):
 
@@ -475,13 +587,15 @@ class post_process:
 
         #fig.add_artist(scenario_legend)
         fig.add_artist(mesh_legend)
-        niceplots.adjust_spines(axs[0])
-        niceplots.adjust_spines(axs[1])
+        for ax in axs:
+            ax.autoscale_view() # Scale to all the lines added by `_add_plot_from_csv`
+            niceplots.adjust_spines(ax) # Needed for every plot, as clearing the axes in `_reset_axes` resets the spine positions
         #fig.tight_layout(rect=[0, 0, 0.95, 1])
+        return mesh_legend
 
     def _get_marker_style(self, idx):
         """
-        Function to loop though the marker styles listed here.
+        Function to loop though the marker styles listed in `self._markers`, set in `__init__`.
         Add more if needed.
 
         Inputs
@@ -494,5 +608,4 @@ class post_process:
         - **Marker Style**: str
             Marker style for the current index
         """
-        markers = ['s', 'o', '^', 'v','X', 'P', '.', 'H', 'p', '*', 'h', '+', 'x']
-        return markers[idx % len(markers)]
\ No newline at end of file
+        return self._markers[idx % len(self._markers)]
\ No newline at end of file
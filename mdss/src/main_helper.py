@@ -4,22 +4,26 @@ Helps run simulations and manages output files.
 """
 
 # Imports
-import os, yaml, copy, subprocess, shutil, time
+import os, sys, csv, json, yaml, subprocess, shutil, time, string, functools, contextlib, codecs
 from datetime import datetime
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from mpi4py import MPI
+try: # Used to enlarge the pipe buffers of the subprocesses, `F_SETPIPE_SZ` is available only on Linux
+    import fcntl
+    F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', None)
+except ImportError:
+    F_SETPIPE_SZ = None
 
 # Module imports
-from mdss.utils.helpers import ProblemType, MachineType, make_dir, print_msg, load_yaml_file, deep_update, load_csv_data
+from mdss.utils.helpers import ProblemType, MachineType, make_dir, print_msg, load_yaml_file, deep_update, fast_deepcopy, SafeLoader, SafeDumper
 from mdss.resources.templates import gl_job_script, python_code_for_hpc, python_code_for_subprocess
-try:
-    from mdss.src.aerostruct import Problem
-    MODULES_NOT_FOUND = False
-except:
-    MODULES_NOT_FOUND = True
 
 comm = MPI.COMM_WORLD
 
+gl_job_script_template = string.Template(gl_job_script) # Compiled once and reused for every job submission
+CSV_HEADER = ["Alpha", "CL", "CD", "FFlag", "WTime"] # Columns of the simulation results csv file of each refinement level
+STREAM_CHUNK_SIZE = 1<<16 # Size of the chunks, in bytes, in which the output of the subprocesses is read
+
 ################################################################################
 # Code for running simulations
 ################################################################################   
@@ -46,67 +50,78 @@ def execute(simulation):
     - Directories are created dynamically if they do not exist.
     - Simulation results are saved in structured output files.
     """
-    if MODULES_NOT_FOUND is True and simulation.subprocess_flag is False:
-        msg = f"""Required module are not present in the current environment. Cannot run without subprocess.
-        Turn on the subprocess flag and specify the eligible python environment or install the required packages"""
-        print_msg(msg, 'error', comm)
-        raise ModuleNotFoundError()
+    if simulation.subprocess_flag is False:
+        try: # Imported only when needed, as it requires mphys and other libraries
+            from mdss.src.aerostruct import Problem
+        except:
+            msg = f"""Required module are not present in the current environment. Cannot run without subprocess.
+            Turn on the subprocess flag and specify the eligible python environment or install the required packages"""
+            print_msg(msg, 'error', comm)
+            raise ModuleNotFoundError()
 
     # Store a copy of input YAML file in output directory
     input_yaml_file = os.path.join(simulation.out_dir, "input_file.yaml")
     if comm.rank == 0:
-        with open(input_yaml_file, 'w') as input_yaml_handle:
-            yaml.dump(simulation.sim_info, input_yaml_handle, sort_keys=False)
+        write_yaml_file(input_yaml_file, simulation.sim_info) # Not rewritten, when resuming with the same input
     
-    sim_info_copy = copy.deepcopy(simulation.sim_info) # Copying to run the loop
-    sim_out_info = copy.deepcopy(simulation.sim_info) # Copying to write the output YAML file
+    sim_info = simulation.sim_info # Only read by the loop below, so it is not copied
+    sim_out_info = fast_deepcopy(simulation.sim_info) # Copying to write the output YAML file
+    other_sim_info = {key: value for key, value in sim_info.items() if key != 'hierarchies'} # To pass just the sim_info without hierarchies
+    other_sim_info['out_dir'] = simulation.out_dir # Absolute path of the output directory, computed once in `simulation`
+    if simulation.subprocess_flag is True and comm.rank == 0: # Saves the python script, that is used to run subprocess in the output directory, if the file do not exist already.
+        try:
+            write_text_file(os.path.join(simulation.out_dir, "script_for_subprocess.py"), python_code_for_subprocess, exclusive=True)
+        except FileExistsError:
+            pass
     start_time = time.time()
     start_wall_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    for hierarchy, hierarchy_info in enumerate(sim_info_copy['hierarchies']): # loop for Hierarchy level
+    for hierarchy, hierarchy_info in enumerate(sim_info['hierarchies']): # loop for Hierarchy level
+        hierarchy_out_info = sim_out_info['hierarchies'][hierarchy] # Matching entry in the output YAML file
 
         for case, case_info in enumerate(hierarchy_info['cases']): # loop for cases in hierarchy
+            case_out_info = hierarchy_out_info['cases'][case]
             # Assign problem type
             problem_type = ProblemType.from_string(case_info['problem'])  # Convert string to enum
 
             # Define case level outptut directory
             case_out_dir = os.path.join(simulation.out_dir, hierarchy_info['name'], case_info['name'])
-            make_dir(case_out_dir, comm)
-            comm.Barrier()
-            # Save case info yaml file in the case_out_dir to pass in subprocess
-            case_info_fpath = os.path.join(case_out_dir, "case_info.yaml")
-            with open(case_info_fpath, 'w') as case_info_fhandle:
-                yaml.dump(case_info, case_info_fhandle, sort_keys=False)
+            make_dir(case_out_dir, comm) # Only the root processor writes in it, before the barrier below
+            # Save case info json file in the case_out_dir to pass in subprocess. Only read by `Problem`, so JSON is used as it is faster to write and parse than YAML
+            case_info_fpath = os.path.join(case_out_dir, "case_info.json")
+            case_info_text, scenario_info_texts = dump_case_info(case_info) # The scenarios are serialized only once, for both the files
+            if comm.rank == 0: # Only the root processor writes the file
+                update_text_file(case_info_fpath, case_info_text)
+            comm.Barrier() # Written before any processor reads it
 
             for scenario, scenario_info in enumerate(case_info['scenarios']): # loop for scenarios that may present
+                scenario_out_info = case_out_info['scenarios'][scenario]
                 
                 # Define scenario level output directory
                 scenario_out_dir = os.path.join(case_out_dir, scenario_info['name'])
-                make_dir(scenario_out_dir, comm)
-                comm.Barrier()
-                # Save case info yaml file in the case_out_dir to pass in subprocess
-                scenario_info_fpath = os.path.join(scenario_out_dir, "scenario_info.yaml")
-                with open(scenario_info_fpath, 'w') as scenario_info_fhandle:
-                    yaml.dump(scenario_info, scenario_info_fhandle, sort_keys=False)
+                make_dir(scenario_out_dir, comm) # Only the root processor writes in it, before the barrier below
+                # Save scenario info json file in the scenario_out_dir to pass in subprocess
+                scenario_info_fpath = os.path.join(scenario_out_dir, "scenario_info.json")
+                if comm.rank == 0: # Only the root processor writes the file
+                    update_text_file(scenario_info_fpath, scenario_info_texts[scenario])
+                comm.Barrier() # Written before any processor reads it
                 
                 # Extract the Angle of attacks for which the simulation has to be run
                 aoa_list = scenario_info['aoa_list']
-                aoa_csv_string = ",".join(map(str, [float(aoa) for aoa in aoa_list]))
+                aoa_list = [float(aoa) for aoa in aoa_list] # making sure aoa is a float
+                aoa_dir_names = [f"aoa_{aoa}" for aoa in aoa_list] # Names of the aoa output directories, same for all the refinement levels
+                aoa_csv_string = ",".join(map(str, aoa_list))
                 scenario_sim_info = {} # Creating scenario level sim info dictionary for overall sim info file
 
                 for ii, mesh_file in enumerate(case_info['mesh_files']): # Loop for refinement levels
                     # Print simulation info message
                     msg = f"{'Hierarchy':<20}: {hierarchy_info['name']}\n{'Case Name':<20}: {case_info['name']}\n{'Scenario':<20}: {scenario_info['name']}\n{'Aero Mesh File':<20}: {mesh_file}"
                     print_msg(msg, f"{'SIMULATION INFO':^30}", comm)
-                    AOAList = []
-                    CLList = []
-                    CDList = []
-                    TList = []
-                    FList = [] # Fail flag list
+                    csv_rows = {} # Rows of the csv file of the successful simulations, keyed by the angle of attack
 
                     refinement_level_dict = {} # Creating refinement level sim info dictionary for overall sim info file
                     refinement_out_dir = os.path.join(scenario_out_dir, f"{mesh_file}")
-                    make_dir(refinement_out_dir, comm)
+                    make_dir(refinement_out_dir, comm, barrier=simulation.subprocess_flag is False) # Without subprocess, every processor runs the problem in it right away
                     aero_grid_fpath = os.path.join(case_info['meshes_folder_path'], mesh_file)
                     # Add struct mesh file for aerostructural case else set it to none
                     if problem_type == ProblemType.AEROSTRUCTURAL:
@@ -116,34 +131,34 @@ def execute(simulation):
 
                     # Run subprocess
                     # Initially running all the aoa in a subprocess. However the optimal number of aoa for single subprocess should be determined and modified accordingly.
-                    other_sim_info = {key: value for key, value in sim_info_copy.items() if key != 'hierarchies'} # To pass just the sim_info without hierarchies
                     if simulation.subprocess_flag is True:
                         run_as_subprocess(other_sim_info, case_info_fpath, scenario_info_fpath, refinement_out_dir, aoa_csv_string, aero_grid_fpath, struct_mesh_file,  comm, simulation.record_subprocess)
+                        comm.Barrier() # Only the root processor runs the subprocess, the others wait for its results
                     elif simulation.subprocess_flag is False:
                         problem = Problem(case_info_fpath, scenario_info_fpath, refinement_out_dir, aoa_csv_string, aero_grid_fpath, struct_mesh_file)
                         problem.run()
                     failed_aoa_list = [] # Initiate a list to store a list of aoa failed in this refinement level
+
+                    # Read the simulation info files of all the aoa on the root processor, and share them in a single broadcast
+                    aoa_sim_info_list = None
+                    if comm.rank == 0:
+                        aoa_sim_info_list = [read_aoa_info(os.path.join(refinement_out_dir, aoa_dir_name, f"{aoa_dir_name}.yaml")) for aoa_dir_name in aoa_dir_names]
+                    aoa_sim_info_list = comm.bcast(aoa_sim_info_list, root=0)
             
-                    for aoa in aoa_list: # loop for angles of attack reads the info, adds additional info if needed for the output file for each aoa
-                        aoa = float(aoa) # making sure aoa is a float
-                        aoa_out_dir = os.path.join(refinement_out_dir, f"aoa_{aoa}") # aoa output directory -- Written to store in the parent directory
-                        aoa_info_file = os.path.join(aoa_out_dir ,f"aoa_{aoa}.yaml") # name of the simulation info file at the aoa level directory
+                    for aoa, aoa_dir_name, aoa_sim_info in zip(aoa_list, aoa_dir_names, aoa_sim_info_list): # loop for angles of attack reads the info, adds additional info if needed for the output file for each aoa
+                        aoa_out_dir = os.path.join(refinement_out_dir, aoa_dir_name) # aoa output directory -- Written to store in the parent directory
                         aoa_level_dict = {} # Creating aoa level sim info dictionary for overall sim info file
 
                         # Checking for existing sucessful simualtion info, 
+                        if not isinstance(aoa_sim_info, dict): # The simulation did not write a readable info file
+                            failed_aoa_list.append(aoa) # Add to the list of failed aoa
+                            continue
                         try:
-                            with open(aoa_info_file, 'r') as aoa_file: # open the simulation info file
-                                aoa_sim_info = yaml.safe_load(aoa_file)
-
                             fail_flag = aoa_sim_info['fail_flag'] # Read the fail flag
 
                             if fail_flag == 0: # Refers successful simulation and makes sure only the sucessful simulations are added to the csv file.
                                 # Add the simulation info to list to be saved as a csv file in the refinement out directory
-                                AOAList.append(aoa_sim_info['AOA'])
-                                CLList.append(aoa_sim_info['cl'])
-                                CDList.append(aoa_sim_info['cd'])
-                                TList.append(float(aoa_sim_info['wall_time'].replace(" sec", "")))
-                                FList.append(fail_flag)
+                                csv_rows[float(aoa_sim_info['AOA'])] = format_csv_row(aoa_sim_info['AOA'], aoa_sim_info['cl'], aoa_sim_info['cd'], fail_flag, aoa_sim_info['wall_time'].replace(" sec", ""))
 
                                 # Store the basic info that is needed to be stored in refinement level dictionary
                                 aoa_level_dict = {
@@ -153,44 +168,19 @@ def execute(simulation):
                                     'fail_flag': int(fail_flag),
                                     'out_dir': aoa_out_dir,
                                 }
-                                refinement_level_dict[f"aoa_{aoa}"] = aoa_level_dict
+                                refinement_level_dict[aoa_dir_name] = aoa_level_dict
                                 
                             elif fail_flag == 1: # refers to failed simulation
                                 failed_aoa_list.append(aoa) # Add to the list of failed aoa
-                            
-                            # Save the aoa_out_dict as an yaml file with the updated info
-                            with open(aoa_info_file, 'w') as interim_out_yaml:
-                                yaml.dump(aoa_sim_info, interim_out_yaml, sort_keys=False)
-                        except:
+                        except (KeyError, TypeError, ValueError, AttributeError): # Missing or invalid entries in the info file
                             failed_aoa_list.append(aoa) # Add to the list of failed aoa
                     ################################# End of AOA loop ########################################
                     refinement_level_dict["failed_aoa"] = failed_aoa_list
                     # Write simulation results to a csv file
-                    refinement_level_data = {
-                        "Alpha": [f"{alpha:6.2f}" for alpha in AOAList],
-                        "CL": [f"{cl:8.4f}" for cl in CLList],
-                        "CD": [f"{cd:8.4f}" for cd in CDList],
-                        "FFlag": [f"{int(FF):12f}" for FF in FList],
-                        "WTime": [f"{wall_time:10.2f}" for wall_time in TList]
-                    }
-
-                    # Define the output file path
-                    refinement_level_dir = os.path.dirname(aoa_out_dir)
+                    refinement_level_dir = refinement_out_dir
                     ADflow_out_file = os.path.join(refinement_level_dir, "ADflow_output.csv")
-                    
-                    df_new = pd.DataFrame(refinement_level_data) # Create a panda DataFrame
-                    # If the file exists, load existing data and append new data
-                    if os.path.exists(ADflow_out_file):
-                        df_existing = load_csv_data(ADflow_out_file, comm)
-                        df_combined = pd.concat([df for df in [df_existing, df_new] if df is not None], ignore_index=True) 
-                    else:
-                        df_combined = df_new
-                    # Ensure Alpha column is float for sorting and deduplication
-                    df_combined['Alpha'] = pd.to_numeric(df_combined['Alpha'], errors='coerce')
-                    df_combined.dropna(subset=['Alpha'], inplace=True)
-                    df_combined.drop_duplicates(subset='Alpha', keep='last', inplace=True)
-                    df_combined.sort_values(by='Alpha', inplace=True)
-                    df_combined.to_csv(ADflow_out_file, index=False)
+                    if comm.rank == 0: # Only the root processor writes the file
+                        update_csv_file(ADflow_out_file, csv_rows)
                     
                     # Add csv file location to the overall simulation out file
                     refinement_level_dict['csv_file'] = ADflow_out_file
@@ -201,16 +191,15 @@ def execute(simulation):
                 ################################# End of refinement loop ########################################
 
                 # Add scenario level simulation to the overall simulation out file
-                scenario_out_dir = os.path.dirname(refinement_level_dir)
                 scenario_sim_info['scenario_out_dir'] = scenario_out_dir
-                sim_out_info['hierarchies'][hierarchy]['cases'][case]['scenarios'][scenario]['sim_info'] = scenario_sim_info
+                scenario_out_info['sim_info'] = scenario_sim_info
 
-                if os.path.exists(scenario_info_fpath): # Remove the scenario_info yaml file
+                if os.path.exists(scenario_info_fpath): # Remove the scenario_info json file
                     if comm.rank==0:
                         os.remove(scenario_info_fpath)
             ################################# End of scenarios loop ########################################
             
-            if os.path.exists(case_info_fpath): # Remove the case_info yaml file
+            if os.path.exists(case_info_fpath): # Remove the case_info json file
                 if comm.rank==0:
                     os.remove(case_info_fpath)
         ################################# End of case loop ########################################
@@ -225,16 +214,16 @@ def execute(simulation):
         'total_wall_time': f"{net_run_time:.2f} sec"
     }
 
-    # Store the final simulation out file.
-    if os.path.exists(simulation.final_out_file):
-        prev_sim_info = load_yaml_file(simulation.final_out_file, comm) # Load the previous sim_out_info
-        deep_update(prev_sim_info, sim_out_info)  # Updates old sim data with the new sim data.
-        final_sim_out_info = prev_sim_info
-    else:
-        final_sim_out_info = sim_out_info
+    # Store the final simulation out file. Merged and written by the root processor only, the others do not need the previous sim_out_info
     if comm.rank == 0:
+        final_sim_out_info = sim_out_info
+        if os.path.exists(simulation.final_out_file):
+            prev_sim_info = load_yaml_file(simulation.final_out_file, None) # Load the previous sim_out_info, without broadcasting it
+            if prev_sim_info is not None:
+                deep_update(prev_sim_info, sim_out_info)  # Updates old sim data with the new sim data.
+                final_sim_out_info = prev_sim_info
         with open(simulation.final_out_file, 'w') as final_out_yaml_handle:
-            yaml.dump(final_sim_out_info, final_out_yaml_handle, sort_keys=False)
+            yaml.dump(final_sim_out_info, final_out_yaml_handle, Dumper=SafeDumper, sort_keys=False, default_flow_style=False)
     comm.Barrier()
 
 ################################################################################
@@ -263,7 +252,7 @@ def submit_job_on_hpc(sim_info, yaml_file_path, comm):
     Notes
     -----
     - Supports customization for the GL cluster with Slurm job scheduling.
-    - Uses regex to update the job script with provided parameters.
+    - Uses `string.Template` to update the job script with provided parameters.
     - Ensures that the correct Python and YAML file paths are embedded in the job script.
     """
     out_dir = os.path.abspath(sim_info['out_dir'])
@@ -276,7 +265,7 @@ def submit_job_on_hpc(sim_info, yaml_file_path, comm):
         mem_per_cpu = hpc_info.get('mem_per_cpu', '1000m')
 
         # Fill in the template of the job script(can be found in `templates.py`) with values from hpc_info, provided by the user
-        job_script = gl_job_script.format(
+        job_script = gl_job_script_template.substitute(
             job_name=hpc_info['job_name'],
             nodes=hpc_info['nodes'],
             nproc=hpc_info['nproc'],
@@ -292,11 +281,8 @@ def submit_job_on_hpc(sim_info, yaml_file_path, comm):
         job_script_path = os.path.join(out_dir, f"{hpc_info['job_name']}_job_file.sh") # Define the path for the job script
 
         if comm.rank==0:
-            with open(job_script_path, "w") as file: # Save the job script to be submitted on great lakes
-                file.write(job_script)
-
-            with open(python_fname, "w") as file: # Write the python file(can be found in `templates.py`) to be run using the above created job script.
-                file.write(python_code_for_hpc)
+            write_text_file(job_script_path, job_script) # Save the job script to be submitted on great lakes
+            write_text_file(python_fname, python_code_for_hpc) # Write the python file(can be found in `templates.py`) to be run using the above created job script.
             
             subprocess.run(["sbatch", job_script_path]) # Subprocess to submit the job script on Great Lakes
         return
@@ -333,7 +319,7 @@ def run_as_subprocess(sim_info, case_info_fpath, scenario_info_fpath, ref_out_di
     -------
     - **None**  
         This function does not return any value but performs the following actions:
-        1. Creates necessary directories and input files.
+        1. Uses the python script saved by `execute` in the output directory to run the simulation.
         2. Launches a subprocess to execute the simulation using `mpirun` or `srun`.
         3. Prints standard output and error logs from the subprocess for debugging.
 
@@ -343,51 +329,243 @@ def run_as_subprocess(sim_info, case_info_fpath, scenario_info_fpath, ref_out_di
     - The generated Python script and YAML input file are specific to each simulation run.
     - Captures and displays `stdout` and `stderr` from the subprocess for troubleshooting.
     """
-    out_dir = os.path.abspath(sim_info['out_dir'])
+    out_dir = os.path.abspath(sim_info['out_dir']) # Does not query the current directory when the path is absolute already
     python_fname = os.path.join(out_dir, "script_for_subprocess.py")
     machine_type = MachineType.from_string(sim_info['machine_type'])
     subprocess_out_file = os.path.join(ref_out_dir, "subprocess_out.txt")
     shell = False
+    is_root = comm.rank == 0 # Only the root process launches the subprocess
 
-    if not os.path.exists(python_fname): # Saves the python script, that is used to run subprocess in the output directory, if the file do not exist already.
-        if comm.rank==0:
-            with open(python_fname, "w") as file: # Open the file in write mode
-                file.write(python_code_for_subprocess)
-
-    env = os.environ.copy()
-    
     python_version = sim_info.get('python_version', 'python') # Update python with user defined version or defaults to current python version
-    if shutil.which(python_version) is None: # Check if the python executable exists
+    python_path = resolve_executable(python_version) # Absolute path, so that the launcher does not search `PATH` for it again
+    if python_path is None: # Check if the python executable exists
         python_version = 'python'
-        if comm.rank == 0:
+        python_path = python_version
+        if is_root:
             print(f"Warning: {python_version} not found! Falling back to default 'python'.")
-    if comm.rank==0:
+    if is_root:
         print_msg(f"Starting subprocess for the following aoa: {aoa_csv_string}", "notice", comm)
         if machine_type==MachineType.LOCAL:
             nproc = sim_info['nproc']
-            run_cmd = ['mpirun', '-np', str(nproc), python_version]
+            run_cmd = [resolve_executable('mpirun') or 'mpirun', '-np', str(nproc), python_path]
             
         elif machine_type==MachineType.HPC:
-            run_cmd = ['srun', python_version]
+            run_cmd = [resolve_executable('srun') or 'srun', python_path]
         run_cmd.extend([python_fname, '--caseInfoFile', case_info_fpath, '--scenarioInfoFile', scenario_info_fpath, 
                 '--refLevelDir', ref_out_dir, '--aoaList', aoa_csv_string, '--aeroGrid', aero_grid_fpath, '--structMesh', struct_mesh_fpath])
 
-        with open(subprocess_out_file, "w") as outfile:
-            p = subprocess.Popen(run_cmd, 
-                env=env,
+        with (open(subprocess_out_file, "wb") if record_flag is True else contextlib.nullcontext()) as outfile: # The file is created only when the output is recorded
+            p = subprocess.Popen(run_cmd, # Inherits the environment of this process
+                close_fds=True, # Keeps the inheritable descriptors opened by the MPI library and other C extensions out of the nested launcher. The absolute path still lets python use vfork
                 stdout=subprocess.PIPE,  # Capture standard output
                 stderr=subprocess.PIPE,  # Capture standard error
-                text=True,  # Ensure output is in text format, not bytes
+                bufsize=STREAM_CHUNK_SIZE, # Output is read in bytes, in large chunks, and is not decoded
                 )
-            
-            for line in p.stdout:
-                print(line, end='')        # Optional: real-time terminal output
-                if record_flag is True:
-                    outfile.write(line)
-                    outfile.flush()
-
-            p.wait() # Wait for subprocess to end
+            enlarge_pipe_buffer(p.stdout)
+            enlarge_pipe_buffer(p.stderr)
+
+            sys.stdout.flush() # Keeps the order of the messages printed before, as the output is written to the underlying buffer
+            stdout_buffer = getattr(sys.stdout, 'buffer', None) # Not available when `sys.stdout` is replaced, e.g., in Jupyter or by `io.StringIO`
+            stdout_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace') # Used without the buffer, keeps the characters split across chunks
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                stderr_future = executor.submit(p.stderr.read) # Drain stderr concurrently, so that the subprocess never blocks on a full stderr pipe
+                try:
+                    while True:
+                        chunk = p.stdout.read1(STREAM_CHUNK_SIZE) # Returns whatever is available, up to the chunk size
+                        if not chunk: # End of the output
+                            break
+                        if stdout_buffer is not None: # Optional: real-time terminal output
+                            stdout_buffer.write(chunk)
+                            stdout_buffer.flush()
+                        else:
+                            sys.stdout.write(stdout_decoder.decode(chunk))
+                            sys.stdout.flush()
+                        if record_flag is True:
+                            outfile.write(chunk)
+                    if stdout_buffer is None:
+                        sys.stdout.write(stdout_decoder.decode(b'', final=True))
+                except BaseException:
+                    p.kill() # Does not leave the subprocess running with its pipes unread
+                    raise
+                finally:
+                    p.wait() # Wait for subprocess to end
+                stderr = stderr_future.result().decode('utf-8', errors='replace')
         
-        _, stderr = p.communicate()
         print_msg(f"{stderr}", 'subprocess error', comm)
-        print_msg(f"Subprocess completed", "notice", comm)
\ No newline at end of file
+        print_msg(f"Subprocess completed", "notice", comm)
+
+def read_aoa_info(aoa_info_file):
+    """
+    Reads the simulation info file written for an angle of attack.
+
+    Inputs
+    ------
+    - **aoa_info_file** : str
+        Path to the aoa level simulation info YAML file.
+
+    Outputs
+    -------
+    - **dict or None**
+        Content of the file, or None if the file does not exist or cannot be read.
+    """
+    if not os.path.isfile(aoa_info_file): # The angle of attack is not simulated yet, checked without raising an exception
+        return None
+    try:
+        with open(aoa_info_file, 'r') as aoa_file: # open the simulation info file
+            return yaml.load(aoa_file, Loader=SafeLoader)
+    except (OSError, yaml.YAMLError):
+        return None
+
+def format_csv_row(aoa, cl, cd, fail_flag, wall_time):
+    """
+    Formats the results of an angle of attack as a row of the simulation results csv file.
+
+    Inputs
+    ------
+    - **aoa**, **cl**, **cd**, **wall_time** : float or str
+        Angle of attack, lift and drag coefficients, and wall time in seconds.
+    - **fail_flag** : int
+        Fail flag of the simulation.
+
+    Outputs
+    -------
+    - **list**
+        Values of the row, as strings.
+    """
+    return [f"{float(aoa):.4f}", f"{float(cl):.4f}", f"{float(cd):.4f}", str(int(fail_flag)), f"{float(wall_time):.4f}"]
+
+def update_csv_file(csv_file, new_rows):
+    """
+    Writes the simulation results csv file of a refinement level. The rows of the existing file are kept, unless `new_rows` has the same angle of attack. The rows are sorted by angle of attack.
+
+    Inputs
+    ------
+    - **csv_file** : str
+        Path to the csv file.
+    - **new_rows** : dict
+        Rows formatted by `format_csv_row`, keyed by the angle of attack.
+    """
+    rows = {}
+    try: # Read the existing file once
+        with open(csv_file, 'r', newline='') as csv_handle:
+            reader = csv.reader(csv_handle)
+            next(reader, None) # Skip the header
+            for row in reader:
+                try:
+                    rows[float(row[0])] = row
+                except (ValueError, IndexError): # Skip the rows without a numeric angle of attack
+                    pass
+    except FileNotFoundError:
+        pass
+    rows.update(new_rows)
+
+    with open(csv_file, 'w', newline='') as csv_handle:
+        writer = csv.writer(csv_handle, lineterminator='\n')
+        writer.writerow(CSV_HEADER)
+        writer.writerows(row for _, row in sorted(rows.items()))
+
+def dump_case_info(case_info):
+    """
+    Serializes the case info, and each of its scenarios, to JSON. Each scenario is serialized once, and the same text is embedded in the case info.
+
+    Inputs
+    ------
+    - **case_info** : dict
+        Case info, with the list of scenarios under `scenarios`.
+
+    Outputs
+    -------
+    - **str**
+        JSON text of the case info.
+    - **list[str]**
+        JSON text of each scenario.
+    """
+    scenario_texts = [json.dumps(scenario_info) for scenario_info in case_info['scenarios']]
+    other_fields = json.dumps({key: value for key, value in case_info.items() if key != 'scenarios'})[1:-1] # Without the braces
+    scenario_field = f'"scenarios": [{", ".join(scenario_texts)}]'
+    case_text = "{" + (f"{other_fields}, {scenario_field}" if other_fields else scenario_field) + "}"
+    return case_text, scenario_texts
+
+def write_yaml_file(fpath, data):
+    """
+    Writes the data to a YAML file, unless the file exists already with the same content.
+
+    Inputs
+    ------
+    - **fpath** : str
+        Path to the YAML file.
+    - **data** : dict
+        Data to write.
+    """
+    update_text_file(fpath, yaml.dump(data, Dumper=SafeDumper, sort_keys=False, default_flow_style=False))
+
+def update_text_file(fpath, text):
+    """
+    Writes the text to a file, unless the file exists already with the same content.
+
+    Inputs
+    ------
+    - **fpath** : str
+        Path to the file.
+    - **text** : str
+        Text to write.
+    """
+    try:
+        with open(fpath, 'r') as text_file:
+            if text_file.read() == text: # Skips the write, the file is up-to-date
+                return
+    except OSError: # The file does not exist, or cannot be read
+        pass
+    write_text_file(fpath, text)
+
+def write_text_file(fpath, text, exclusive=False):
+    """
+    Writes the text to a file using a single `os.write` call on an unbuffered file descriptor, instead of the buffered text file layer.
+
+    Inputs
+    ------
+    - **fpath** : str
+        Path to the file. Overwritten if it exists already, unless `exclusive` is True.
+    - **text** : str
+        Text to write.
+    - **exclusive** : bool=False, Optional
+        When True, raises `FileExistsError` if the file exists already, instead of overwriting it.
+    """
+    data = memoryview(text.encode('utf-8'))
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_EXCL if exclusive else os.O_TRUNC)
+    fd = os.open(fpath, flags, 0o644)
+    try:
+        while data: # os.write can write fewer bytes than requested
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+@functools.lru_cache(maxsize=None)
+def resolve_executable(executable):
+    """
+    Returns the absolute path to the executable, such as python or mpirun, or None when it is not found. The result is cached, so that `PATH` is searched only once per executable.
+
+    Inputs
+    ------
+    - **executable** : str
+        Name of, or path to, the executable.
+    """
+    return shutil.which(executable)
+
+def enlarge_pipe_buffer(pipe, size=1<<20):
+    """
+    Enlarges the kernel buffer of a pipe, when supported by the OS. Lets the subprocess write its output without waiting for every read from the pipe.
+
+    Inputs
+    ------
+    - **pipe** : file object
+        Pipe connected to the subprocess.
+    - **size** : int=1MB, Optional
+        Requested size of the buffer in bytes.
+    """
+    if F_SETPIPE_SZ is None:
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), F_SETPIPE_SZ, size)
+    except OSError: # The requested size may exceed the limit allowed for the user, the default buffer is kept
+        pass
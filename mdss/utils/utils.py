@@ -1,4 +1,3 @@
-import copy
 
 from mpi4py import MPI
 from enum import Enum
@@ -6,9 +5,9 @@ import os
 import shutil
 import yaml
 import importlib.resources as pkg_resources
-import random
+import tempfile
 from pydantic import BaseModel
-from typing import Optional, Literal
+from typing import Optional
 
 from mdss.src.main import simulation
 from mdss.utils.helpers import *
@@ -47,9 +46,20 @@ class update_info_file():
     """
 
     def __init__(self, info_file):
-        check_input_yaml(info_file)
         self.info_file = info_file
         self.sim_info = load_yaml_file(self.info_file, comm)
+        check_input_yaml(self.sim_info, comm) # Validates the loaded content, without parsing the file again
+        # Cases keyed by name, the hierarchies are walked once rather than by every method. Names may repeat across hierarchies
+        self._case_index = {}
+        for hierarchy_info in self.sim_info['hierarchies']:
+            for case_info in hierarchy_info['cases']:
+                self._case_index.setdefault(case_info['name'], []).append(case_info)
+
+    def _get_cases(self, case_names):
+        """
+        Returns the cases with the given names, from all the hierarchies.
+        """
+        return [case_info for case_name in dict.fromkeys(case_names) for case_info in self._case_index.get(case_name, ())]
 
     def aero_options(self, aero_options_updt, case_names):
         """
@@ -62,11 +72,8 @@ class update_info_file():
             A list containing the names of the cases to modify.
             
         """
-
-        for hierarchy, hierarchy_info in enumerate(self.sim_info['hierarchies']): # loop for Hierarchy level
-            for case, case_info in enumerate(hierarchy_info['cases']): # loop for cases in hierarchy
-                if case_info['name'] in case_names:
-                    case_info['aero_options'].update(aero_options_updt)
+        for case_info in self._get_cases(case_names): # loop for the cases to modify
+            case_info['aero_options'].update(aero_options_updt)
     
     def aero_meshes(self, mesh_files, case_names, option,  meshes_folder_path=None):
         """
@@ -84,17 +91,16 @@ class update_info_file():
         - **meshes_folder_path**: str, optional
             Path to the folder containing meshes
         """
-        for hierarchy, hierarchy_info in enumerate(self.sim_info['hierarchies']): # loop for Hierarchy level
-            for case, case_info in enumerate(hierarchy_info['cases']): # loop for cases in hierarchy
-                if case_info['name'] in case_names:
-                    if option == 'a':
-                        case_info['mesh_files'].append(mesh_files)
-                    elif option == 'm':
-                        case_info['mesh_files'] = [mesh_file for mesh_file in case_info['mesh_files']]
-                    elif option == 'r':
-                        case_info['mesh_files']= [mesh_file for mesh_file in case_info['mesh_files'] if mesh_file not in mesh_files]
-                    if meshes_folder_path is not None:
-                        case_info['meshes_folder_path'] = meshes_folder_path
+        mesh_files_to_remove = set(mesh_files) if option == 'r' else None
+        for case_info in self._get_cases(case_names): # loop for the cases to modify
+            if option == 'a':
+                case_info['mesh_files'].append(mesh_files)
+            elif option == 'm':
+                case_info['mesh_files'] = [mesh_file for mesh_file in case_info['mesh_files']]
+            elif option == 'r':
+                case_info['mesh_files']= [mesh_file for mesh_file in case_info['mesh_files'] if mesh_file not in mesh_files_to_remove]
+            if meshes_folder_path is not None:
+                case_info['meshes_folder_path'] = meshes_folder_path
 
     
     def aoa(self, aoa_list, case_names, scenario_names, option):
@@ -115,17 +121,19 @@ class update_info_file():
             'm' to modify the list (to overwrite)
             'r' to remove the aoa from the file.
         """
-        for hierarchy, hierarchy_info in enumerate(self.sim_info['hierarchies']): # loop for Hierarchy level
-            for case, case_info in enumerate(hierarchy_info['cases']): # loop for cases in hierarchy
-                if case_info['name'] in case_names:
-                    for scenario, scenario_info in enumerate(case_info['scenarios']): # loop for scenarios that may present
-                        if scenario_info['name'] in scenario_names:
-                            if option == 'a':
-                                scenario_info['aoa_list'] = list(set(scenario_info['aoa_list']) | set(aoa_list))  # Convert both to sets to remove duplicates, then back to a list
-                            elif option == 'm':
-                                scenario_info['aoa_list'] = [aoa for aoa in scenario_info['aoa_list']]
-                            elif option == 'r':
-                                scenario_info['aoa_list']= [aoa for aoa in scenario_info['aoa_list'] if aoa not in aoa_list]
+        scenario_names = set(scenario_names) # Constant time membership checks
+        aoa_set = set(aoa_list) # To add or remove, built once for all the scenarios
+        for case_info in self._get_cases(case_names): # loop for the cases to modify
+            for scenario, scenario_info in enumerate(case_info['scenarios']): # loop for scenarios that may present
+                if scenario_info['name'] in scenario_names:
+                    if option == 'a':
+                        scenario_aoa_set = set(scenario_info['aoa_list'])
+                        scenario_aoa_set.update(aoa_set) # Sets remove the duplicates
+                        scenario_info['aoa_list'] = sorted(scenario_aoa_set) # Back to a list, in a deterministic order
+                    elif option == 'm':
+                        scenario_info['aoa_list'] = [aoa for aoa in scenario_info['aoa_list']]
+                    elif option == 'r':
+                        scenario_info['aoa_list']= [aoa for aoa in scenario_info['aoa_list'] if aoa not in aoa_set]
     
     def write_mod_info_file(self, new_fname=None):
         """
@@ -138,9 +146,9 @@ class update_info_file():
             if new_fname is None:
                 new_fname = self.info_file
             with open(new_fname, 'w') as info_file_fhandle:
-                yaml.dump(self.sim_info, info_file_fhandle, sort_keys=False)
+                yaml.dump(self.sim_info, info_file_fhandle, Dumper=SafeDumper, sort_keys=False)
 
-def get_sim_data(info_file):
+def get_sim_data(info_file, validate=True):
     """
     Generates a dictionary containing simulation data organized hierarchically.
 
@@ -152,28 +160,30 @@ def get_sim_data(info_file):
     ------
     - **info_file** : str
         Path to the input YAML file containing simulation information or configuration.
+    - **validate** : bool=True, Optional
+        Validates the file. Can be turned off when the file was validated already, e.g., by the `simulation` that wrote the results.
 
     Outputs
     -------
     **sim_data**: dict
         A dictionary contating simulation data.
     """
-    check_input_yaml(info_file)
-    if comm.rank == 0:
+    info = load_yaml_file(info_file, comm)
+    if validate:
+        check_input_yaml(info, comm) # Validates the loaded content, without parsing the file again
+    if validate and comm.rank == 0:
         print(f"{'-' * 50}")
         print("YAML file validation is successful")
         print(f"{'-' * 50}")
-    info = load_yaml_file(info_file, comm)
     sim_data = {} # Initiating a dictionary to store simulation data
 
-    try:  # Check if the file is overall sim info file and stores the simulation info
-        overall_sim_info = info["overall_sim_info"]
-        sim_info = copy.deepcopy(info)
+    if "overall_sim_info" in info:  # Check if the file is overall sim info file and stores the simulation info
+        overall_sim_info = info # The output file has the simulation info of every scenario
         print(f"{'-' * 50}")
         print(f"File provided is an ouput yaml file. Continuing to read data")
         print(f"{'-' * 50}")
 
-    except KeyError:  # if the file is input info file, loads the overall_sim_info.yaml if the simulation is run already
+    else:  # if the file is input info file, loads the overall_sim_info.yaml if the simulation is run already
         if comm.rank == 0:
             print(f"{'-' * 50}")
             print(f"File provided is an input yaml file. Checking for existing simulation results in {info['out_dir']}")
@@ -187,61 +197,80 @@ def get_sim_data(info_file):
                 print(f"{'-' * 50}")
                 print(f"No existing simulation found in {info['out_dir']}")
                 print(f"{'-' * 50}")
+            return sim_data
         
     
-    # Loop through hierarchy levels
-    for hierarchy_index, hierarchy_info in enumerate(overall_sim_info['hierarchies']):
-        hierarchy_name = hierarchy_info['name']
-        if hierarchy_name not in sim_data:
-            sim_data[hierarchy_name] = {}
-
-        # Loop through cases in the hierarchy
-        for case_index, case_info in enumerate(hierarchy_info['cases']):
-            case_name = case_info['name']
-            if case_name not in sim_data[hierarchy_name]:
-                sim_data[hierarchy_name][case_name] = {}
-
-            # Loop through scenarios in the case
-            for scenario_index, scenario_info in enumerate(case_info['scenarios']):
-                scenario_name = scenario_info['name']
-                if scenario_info['name'] not in sim_data[hierarchy_name][case_name]:
-                    sim_data[hierarchy_name][case_name][scenario_name] = {}
-
-                # Loop through mesh files
-                for ii, mesh_file in enumerate(case_info['mesh_files']):
-                    refinement_level = f"L{ii}"
-                    failed_aoa = scenario_info['sim_info'][refinement_level]['failed_aoa']
-                    if refinement_level not in sim_data[hierarchy_name][case_name][scenario_name]:
-                        sim_data[hierarchy_name][case_name][scenario_name][refinement_level] = {}
-
-                    # Loop through angles of attack
-                    for aoa in scenario_info['aoa_list']:
-                        if aoa not in failed_aoa:
-                            aoa_key = f"aoa_{float(aoa)}"
-                            cl = scenario_info['sim_info'][refinement_level][aoa_key].get("cl")
-                            cd = scenario_info['sim_info'][refinement_level][aoa_key].get("cd")
-
-                            # Populate the dictionary
-                            if aoa_key not in sim_data[hierarchy_name][case_name][scenario_name][refinement_level]:
-                                sim_data[hierarchy_name][case_name][scenario_name][refinement_level][aoa_key] = {}
-
-                            sim_data[hierarchy_name][case_name][scenario_name][refinement_level][aoa_key]['cl'] = cl
-                            sim_data[hierarchy_name][case_name][scenario_name][refinement_level][aoa_key]['cd'] = cd
-                    sim_data[hierarchy_name][case_name][scenario_name][refinement_level]['failed_aoa'] = failed_aoa
+    # Loop through hierarchy levels and cases, the scenarios are built with a dict comprehension
+    for hierarchy_info in overall_sim_info['hierarchies']:
+        hierarchy_data = sim_data.setdefault(hierarchy_info['name'], {})
+        for case_info in hierarchy_info['cases']:
+            case_data = hierarchy_data.setdefault(case_info['name'], {})
+            mesh_files = case_info['mesh_files']
+            for scenario_info in case_info['scenarios']:
+                scenario_sim_info = scenario_info['sim_info'] # Keyed by the mesh files, as written by `execute`
+                aoa_keys = [(aoa, f"aoa_{float(aoa)}") for aoa in scenario_info['aoa_list']] # Formatted once, shared by the mesh files
+                case_data[scenario_info['name']] = {
+                    mesh_file: get_refinement_level_data(scenario_sim_info[mesh_file], aoa_keys)
+                    for mesh_file in mesh_files
+                }
 
     return sim_data
 
+def get_refinement_level_data(refinement_sim_info, aoa_keys):
+    """
+    Returns the C<sub>L</sub> and C<sub>D</sub> of the successful angles of attack of a refinement level, along with the list of failed angles of attack.
+
+    Inputs
+    ------
+    - **refinement_sim_info** : dict
+        Refinement level entry of the overall simulation info file.
+    - **aoa_keys** : list[tuple]
+        Angles of attack of the scenario, each paired with its `aoa_<aoa>` key.
+
+    Outputs
+    -------
+    **refinement_data**: dict
+        Dictionary keyed by `aoa_<aoa>`, with the `failed_aoa` list.
+    """
+    failed_aoa = refinement_sim_info['failed_aoa']
+    failed_aoa_set = set(failed_aoa)
+    refinement_data = {}
+    for aoa, aoa_key in aoa_keys:
+        if aoa in failed_aoa_set:
+            continue
+        aoa_info = refinement_sim_info[aoa_key]
+        refinement_data[aoa_key] = {'cl': aoa_info.get("cl"), 'cd': aoa_info.get("cd")}
+    refinement_data['failed_aoa'] = failed_aoa
+    return refinement_data
+
 ################################################################################
 # Functions to run predetermined simulations
 ################################################################################
 
-class ref_case_info(BaseModel):
-    hpc: Optional[Literal['yes', 'no']]='no'
-    hpc_info: Optional[dict]=None
-    meshes_folder_path: str
-    mesh_files: list[str]
-    aoa_list: list[float]
-    solver_parameters: Optional[dict]=None
+def make_temp_dir(parent_dir=None):
+    """
+    Creates a uniquely named temporary folder on the root process, and shares its path with all the processes.
+    The broadcast returns only after the folder is created, so no barrier is needed before using it.
+
+    Inputs
+    ------
+    - **parent_dir** : str, Optional
+        Path to the directory in which the temporary folder is created. Defaults to the current working directory, looked up on the root process only.
+
+    Outputs
+    -------
+    **temp_dir**: str
+        Absolute path to the temporary folder.
+    """
+    temp_dir = None
+    if comm.rank == 0:
+        print(f"{'-' * 50}")
+        print("Creating a the temporary folder to run simulations")
+        print(f"{'-' * 50}")
+        if parent_dir is None:
+            parent_dir = os.getcwd()
+        temp_dir = tempfile.mkdtemp(prefix="temp_", dir=parent_dir) # Unique name, created atomically
+    return comm.bcast(temp_dir, root=0)
 
 class ref_hpc_info:
     job_name: Optional[str]
@@ -286,7 +315,7 @@ def run_case(case, case_info):
     - Creates a temporary directory for the simulation input and output files.
     - Deletes the temporary directory after the simulation run.
     """
-    ref_case_info.model_validate(case_info)
+    case_info_validator.validate_python(case_info)
     # Validate or set default for 'hpc'
     if 'hpc' not in case_info:
         case_info['hpc'] = 'no'
@@ -294,27 +323,12 @@ def run_case(case, case_info):
     if case_info['hpc'] == 'yes':
         ref_hpc_info.model_validate(case_info['hpc_info'])
     
-    if comm.rank == 0:
-        randn = random.randint(1000, 9999)
-    else:
-        # Other processes initialize the variable
-        randn = None
-    
-    # Broadcast the random number to all processes
-    randn = comm.bcast(randn, root=0)
-    
-    cwd = os.getcwd()
-    temp_dir = f"{cwd}/temp_{randn}"
-    if comm.rank == 0:
-        print(f"{'-' * 50}")
-        print("Creating a the temporary folder to run simulations")
-        print(f"{'-' * 50}")
-        os.mkdir(temp_dir)
+    temp_dir = make_temp_dir()
 
 
     input_file  = f"{case}_simInfo.yaml"
     with pkg_resources.open_text('mdss.resources', input_file) as f:
-        sim_info = yaml.safe_load(f)
+        sim_info = yaml.load(f, Loader=SafeLoader)
     try:
         sim_info['hpc'] = case_info['hpc']
     except:
@@ -341,11 +355,12 @@ def run_case(case, case_info):
     if 'out_dir' in case_info:
         sim_info['out_dir'] = case_info['out_dir']
     else:
-        sim_info['out_dir'] = f"{cwd}/{temp_dir}/output"
+        sim_info['out_dir'] = os.path.join(temp_dir, "output") # temp_dir is an absolute path already
     
     new_input_file = f"{temp_dir}/input.yaml"
-    with open(new_input_file, 'w') as f:
-        yaml.safe_dump(sim_info, f)
+    if comm.rank == 0: # Streamed to the file once, the other processes read it after the barrier
+        with open(new_input_file, 'w') as f:
+            yaml.dump(sim_info, f, Dumper=SafeDumper)
 
     comm.Barrier()
 
@@ -419,6 +434,8 @@ class ref_case_info(BaseModel):
     aoa_list: list[float]
     aero_options: Optional[dict]=None
     struct_options: dict=None
+
+case_info_validator = ref_case_info.__pydantic_validator__ # Built once with the model, used directly rather than through `model_validate`
     
 class run_custom_sim():
     """
@@ -461,13 +478,13 @@ class run_custom_sim():
             input_file  = f"{name}_simInfo.yaml"
             try:
                 with pkg_resources.open_text('mdss.resources', input_file) as f:
-                    sim_info = yaml.safe_load(f)
+                    sim_info = yaml.load(f, Loader=SafeLoader)
             except:
                 err_msg = f"Error: The Simulation Info file for {name} is not available in the package.\nPlease provide a local resources directory path."
                 raise FileNotFoundError(err_msg)
         else:
             input_file = os.path.join(os.path.abs(self.resources_dir), f"{name}_simInfo.yaml")
-            check_input_yaml(input_file)
+            check_input_yaml(input_file, comm)
             sim_info = load_yaml_file(input_file)
             
         self.sim_info = sim_info
@@ -484,7 +501,7 @@ class run_custom_sim():
             - `aero_options` (Optional[dict]): Dictionary containing ADflow solver parameters (optional).
             - `struct_options` (Optional[dict]): Dictionary containing structural info for aero structural problem (optional).
         """
-        ref_case_info.model_validate(case_info)
+        case_info_validator.validate_python(case_info)
         # Update Info
         self.sim_info['hierarchies'][0]['cases'][0]['meshes_folder_path'] = case_info['meshes_folder_path']
         self.sim_info['hierarchies'][0]['cases'][0]['mesh_files'] = case_info['mesh_files']
@@ -494,37 +511,23 @@ class run_custom_sim():
         if 'struct_options' in case_info.keys():
             self.sim_info['hierarchies'][0]['cases'][0]['struct_options'].update(case_info['struct_options'])
 
-        if comm.rank == 0:
-            randn = random.randint(1000, 9999)
-        else:
-            # Other processes initialize the variable
-            randn = None
-        
-        # Broadcast the random number to all processes
-        randn = comm.bcast(randn, root=0)
-        cwd = os.getcwd()
-        temp_dir = os.path.join(cwd, f"temp_{randn}")
-        if comm.rank == 0:
-            print(f"{'-' * 50}")
-            print("Creating a the temporary folder to run simulations")
-            print(f"{'-' * 50}")
-            os.mkdir(temp_dir)
-        comm.Barrier()
+        temp_dir = make_temp_dir()
         if 'out_dir' in case_info.keys():
             self.sim_info['out_dir'] = case_info['out_dir']
         else:
             self.sim_info['out_dir'] = temp_dir
         
         new_input_file = f"{temp_dir}/input.yaml"
-        with open(new_input_file, 'w') as f:
-            yaml.safe_dump(self.sim_info, f)
+        if comm.rank == 0: # Streamed to the file once, the other processes read it after the barrier
+            with open(new_input_file, 'w') as f:
+                yaml.dump(self.sim_info, f, Dumper=SafeDumper)
 
         comm.Barrier()
         # Execute simulation
         sim = simulation(new_input_file)
         sim.subprocess_flag = 0 
         sim.run()
-        sim_data = get_sim_data(new_input_file)
+        sim_data = get_sim_data(new_input_file, validate=False) # Validated by `simulation` already
 
         comm.Barrier()
         if comm.rank == 0: